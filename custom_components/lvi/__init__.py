@@ -1,14 +1,98 @@
 """The lvi component."""
 
+from lvi import Lvi
+import voluptuous as vol
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    ATTR_AWAY_TEMP,
+    ATTR_COMFORT_TEMP,
+    ATTR_ROOM_NAME,
+    ATTR_SLEEP_TEMP,
+    DATA_CONNECTION,
+    DATA_COORDINATOR,
+    DOMAIN,
+    SERVICE_SET_ROOM_TEMP,
+)
+from .coordinator import LviDataUpdateCoordinator
+
 PLATFORMS = ["climate"]
 
+SET_ROOM_TEMP_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ROOM_NAME): cv.string,
+        vol.Optional(ATTR_AWAY_TEMP): cv.positive_int,
+        vol.Optional(ATTR_COMFORT_TEMP): cv.positive_int,
+        vol.Optional(ATTR_SLEEP_TEMP): cv.positive_int,
+    }
+)
+
 
 async def async_setup_entry(hass, entry):
     """Set up the Lvi heater."""
+    lvi_data_connection = Lvi(
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        websession=async_get_clientsession(hass),
+    )
+    if not await lvi_data_connection.connect():
+        raise ConfigEntryNotReady
+
+    coordinator = LviDataUpdateCoordinator(hass, lvi_data_connection)
+    await coordinator.async_config_entry_first_refresh()
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        DATA_CONNECTION: lvi_data_connection,
+        DATA_COORDINATOR: coordinator,
+    }
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_ROOM_TEMP):
+
+        async def set_room_temp(service):
+            """Set room temp."""
+            await _async_set_room_temp(hass, service.data)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SET_ROOM_TEMP,
+            set_room_temp,
+            schema=SET_ROOM_TEMP_SCHEMA,
+        )
     return True
 
 
 async def async_unload_entry(hass, entry):
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_SET_ROOM_TEMP)
+    return unload_ok
+
+
+async def _async_set_room_temp(hass, data):
+    """Set the temperatures of a room on the account(s) that have it."""
+    room_name = data[ATTR_ROOM_NAME]
+    connections = [
+        entry_data[DATA_CONNECTION]
+        for entry_data in hass.data[DOMAIN].values()
+        if any(
+            heater.room and heater.room.name == room_name
+            for heater in entry_data[DATA_CONNECTION].heaters.values()
+        )
+    ]
+    if not connections:
+        raise HomeAssistantError(f"No LVI heater found in room {room_name}")
+    for connection in connections:
+        await connection.set_room_temperatures_by_name(
+            room_name,
+            data.get(ATTR_SLEEP_TEMP),
+            data.get(ATTR_COMFORT_TEMP),
+            data.get(ATTR_AWAY_TEMP),
+        )
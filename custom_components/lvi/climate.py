@@ -1,7 +1,8 @@
 """Support for LVI wifi-enabled home heaters."""
 
-from lvi import Lvi
-import voluptuous as vol
+import asyncio
+from dataclasses import replace
+from functools import cached_property
 import logging
 
 from homeassistant.components.climate import ClimateEntity
@@ -14,169 +15,133 @@ from homeassistant.components.climate.const import (
     SUPPORT_FAN_MODE,
     SUPPORT_TARGET_TEMPERATURE
 )
-from homeassistant.const import (
-    ATTR_TEMPERATURE,
-    CONF_PASSWORD,
-    CONF_USERNAME,
-    TEMP_CELSIUS,
-)
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import ATTR_TEMPERATURE, TEMP_CELSIUS
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
-    ATTR_AWAY_TEMP,
-    ATTR_COMFORT_TEMP,
-    ATTR_ROOM_NAME,
-    ATTR_SLEEP_TEMP,
+    DATA_CONNECTION,
+    DATA_COORDINATOR,
     DOMAIN,
     MANUFACTURER,
     MAX_TEMP,
     MIN_TEMP,
-    SERVICE_SET_ROOM_TEMP,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 SUPPORT_FLAGS = SUPPORT_TARGET_TEMPERATURE | SUPPORT_FAN_MODE
 
-SET_ROOM_TEMP_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_ROOM_NAME): cv.string,
-        vol.Optional(ATTR_AWAY_TEMP): cv.positive_int,
-        vol.Optional(ATTR_COMFORT_TEMP): cv.positive_int,
-        vol.Optional(ATTR_SLEEP_TEMP): cv.positive_int,
-    }
-)
+# State is fetched by the coordinator, so entity updates need no semaphore.
+PARALLEL_UPDATES = 0
+
+SET_TEMP_COOLDOWN = 0.5
+
+# Seconds a commanded value is kept on top of polled data until a poll shows
+# it. Polls that still return the old value do not undo the change. If the
+# backend has not confirmed it by then, the last polled state is shown.
+OPTIMISTIC_TIMEOUT = 150.0
+
+# Heater attribute holding the setpoint for each gv_mode, frost guard otherwise.
+_GV_MODE_ATTR = {
+    "0": "consigne_confort",
+    "3": "consigne_eco",
+    "4": "consigne_boost",
+    "8": "consigne_manuel",
+}
+_SETPOINT_ATTRS = (*_GV_MODE_ATTR.values(), "consigne_hg")
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the LVI heater."""
-    lvi_data_connection = Lvi(
-        entry.data[CONF_USERNAME],
-        entry.data[CONF_PASSWORD],
-        websession=async_get_clientsession(hass),
-    )
-    if not await lvi_data_connection.connect():
-        raise ConfigEntryNotReady
-
-    await lvi_data_connection.find_all_heaters()
-
-    dev = []
-    for heater in lvi_data_connection.heaters.values():
-        dev.append(LviHeater(heater, lvi_data_connection))
-    async_add_entities(dev)
-
-    async def set_room_temp(service):
-        """Set room temp."""
-        room_name = service.data.get(ATTR_ROOM_NAME)
-        sleep_temp = service.data.get(ATTR_SLEEP_TEMP)
-        comfort_temp = service.data.get(ATTR_COMFORT_TEMP)
-        away_temp = service.data.get(ATTR_AWAY_TEMP)
-        await lvi_data_connection.set_room_temperatures_by_name(
-            room_name, sleep_temp, comfort_temp, away_temp
-        )
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    lvi_data_connection = entry_data[DATA_CONNECTION]
+    coordinator = entry_data[DATA_COORDINATOR]
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_SET_ROOM_TEMP, set_room_temp, schema=SET_ROOM_TEMP_SCHEMA
+    async_add_entities(
+        LviHeater(coordinator, heater, lvi_data_connection)
+        for heater in lvi_data_connection.heaters.values()
     )
 
 
-class LviHeater(ClimateEntity):
+class LviHeater(CoordinatorEntity, ClimateEntity):
     """Representation of a LVI Thermostat device."""
 
-    def __init__(self, heater, lvi_data_connection):
+    _attr_fan_modes = [FAN_ON, HVAC_MODE_OFF]
+    _attr_hvac_modes = [HVAC_MODE_HEAT, HVAC_MODE_OFF]
+    _attr_max_temp = MAX_TEMP
+    _attr_min_temp = MIN_TEMP
+    _attr_supported_features = SUPPORT_FLAGS
+    _attr_target_temperature_step = 1
+    _attr_temperature_unit = TEMP_CELSIUS
+
+    def __init__(self, coordinator, heater, lvi_data_connection):
         """Initialize the thermostat."""
-        self._heater = heater
+        super().__init__(coordinator)
+        self._state = coordinator.data[heater.device_id]
         self._conn = lvi_data_connection
-
-    @property
-    def supported_features(self):
-        """Return the list of supported features."""
-        return SUPPORT_FLAGS
+        self._last_state = None
+        self._optimistic = {}
+        self._unsub_optimistic = None
+        self._write_lock = asyncio.Lock()
+        self._pending_temp = None
+        self._set_temp_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=SET_TEMP_COOLDOWN,
+            immediate=False,
+            function=self._flush_set_temp,
+        )
+        self._attr_unique_id = heater.device_id
+        if heater.room:
+            self._room_name = heater.room.name
+        else:
+            self._room_name = "Independent device"
+        self._attr_name = f"{heater.nom_appareil}-{self._room_name}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, heater.device_id)},
+            name=self._attr_name,
+            manufacturer=MANUFACTURER,
+            model="generation 2",
+        )
 
     @property
     def available(self):
         """Return True if entity is available."""
         """TODO: Check up when oven is turned off"""
-        return self._heater.available
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._heater.device_id
-
-    @property
-    def name(self):
-        """Return the name of the entity."""
-        return self._heater.nom_appareil + '-' + self._heater.room.name
+        return super().available and self._state.available
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        res = {
-            "heating": self._heater.heating_up
+        return {
+            "heating": self._state.heating_up,
+            "room": self._room_name,
         }
-        if self._heater.room:
-            res["room"] = self._heater.room.name
-        else:
-            res["room"] = "Independent device"
-        return res
-
-    @property
-    def temperature_unit(self):
-        """Return the unit of measurement which this thermostat uses."""
-        return TEMP_CELSIUS
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-
-        if self._heater.gv_mode == '0':
-            return self._heater.consigne_confort
-        elif self._heater.gv_mode == '8':
-            return self._heater.consigne_manuel
-        elif self._heater.gv_mode == '3':
-            return self._heater.consigne_eco
-        elif self._heater.gv_mode == '4':
-            return self._heater.consigne_boost
-        else:
-            return self._heater.consigne_hg
-
-    @property
-    def target_temperature_step(self):
-        """Return the supported step of target temperature."""
-        return 1
+        attr = _GV_MODE_ATTR.get(self._state.gv_mode, "consigne_hg")
+        return getattr(self._state, attr)
 
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return self._heater.current_temp
+        return self._state.current_temp
 
     @property
     def fan_mode(self):
         """Return the fan setting."""
-        return FAN_ON if self._heater.fan_speed != 0 else HVAC_MODE_OFF
-
-    @property
-    def fan_modes(self):
-        """List of available fan modes."""
-        return [FAN_ON, HVAC_MODE_OFF]
-
-    @property
-    def min_temp(self):
-        """Return the minimum temperature."""
-        return MIN_TEMP
-
-    @property
-    def max_temp(self):
-        """Return the maximum temperature."""
-        return MAX_TEMP
+        return FAN_ON if self._state.fan_speed else HVAC_MODE_OFF
 
     @property
     def hvac_action(self):
         """Return current hvac i.e. heat, cool, idle."""
-        if self._heater.heating_up:
+        if self._state.heating_up:
             return CURRENT_HVAC_HEAT
         return CURRENT_HVAC_IDLE
 
@@ -185,52 +150,149 @@ class LviHeater(ClimateEntity):
         """Return hvac operation ie. heat, cool mode.
         Need to be one of HVAC_MODE_*.
         """
-        if self._heater.power_status == 1:
+        if self._state.power_status == 1:
             return HVAC_MODE_HEAT
         return HVAC_MODE_OFF
 
-    @property
-    def hvac_modes(self):
-        """Return the list of available hvac operation modes.
-        Need to be a subset of HVAC_MODES.
-        """
-        return [HVAC_MODE_HEAT, HVAC_MODE_OFF]
-
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        await self._conn.set_heater_temp(self._heater.device_id, int(temperature))
+        self._pending_temp = int(temperature)
+        attr = _GV_MODE_ATTR.get(self._state.gv_mode, "consigne_hg")
+        self._async_apply_optimistic(**{attr: self._pending_temp})
+        await self._set_temp_debouncer.async_call()
+
+    async def _flush_set_temp(self):
+        """Send the last requested target temperature to the heater."""
+        temperature = self._pending_temp
+        if temperature is None:
+            return
+        self._pending_temp = None
+        try:
+            async with self._write_lock:
+                await self._conn.set_heater_temp(self.device_id, temperature)
+        except Exception:  # pylint: disable=broad-except
+            # This runs from the debouncer timer, so nothing would report
+            # the failure to the service caller; log it and show real state.
+            _LOGGER.exception(
+                "Failed to set target temperature of %s to %s",
+                self.entity_id,
+                temperature,
+            )
+            self._async_revert_optimistic(*_SETPOINT_ATTRS)
+            await self.coordinator.async_request_refresh()
 
     async def async_set_fan_mode(self, fan_mode):
         """Set new target fan mode."""
         fan_status = 1 if fan_mode == FAN_ON else 0
-        await self._conn.heater_control(self._heater.device_id, fan_status=fan_status)
+        async with self._write_lock:
+            await self._conn.heater_control(
+                self.device_id, fan_status=fan_status
+            )
+        self._async_apply_optimistic(fan_speed=fan_status)
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
         if hvac_mode == HVAC_MODE_HEAT:
-            await self._conn.heater_control(self._heater.device_id, power_status=1)
+            power_status = 1
         elif hvac_mode == HVAC_MODE_OFF:
-            await self._conn.heater_control(self._heater.device_id, power_status=0)
-
-    async def async_update(self):
-        """Retrieve latest state."""
-        self._heater = await self._conn.update_device(self._heater.device_id)
+            power_status = 0
+        else:
+            return
+        async with self._write_lock:
+            await self._conn.heater_control(
+                self.device_id, power_status=power_status
+            )
+        self._async_apply_optimistic(power_status=power_status)
+
+    async def async_will_remove_from_hass(self):
+        """Send any pending target temperature before removal."""
+        await super().async_will_remove_from_hass()
+        self._set_temp_debouncer.async_cancel()
+        self._async_cancel_optimistic_timeout()
+        if self._pending_temp is not None:
+            await self._flush_set_temp()
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
+        self._async_read_coordinator_state()
+
+    @callback
+    def _async_read_coordinator_state(self):
+        """Take the heater state from the coordinator data.
+
+        Commanded values the poll does not show yet are kept on top of it.
+        """
+        state = self.coordinator.data.get(self.device_id)
+        if state is None:
+            # The heater is no longer part of the account.
+            state = replace(self._state, available=False)
+        if self._optimistic:
+            self._optimistic = {
+                attr: value
+                for attr, value in self._optimistic.items()
+                if getattr(state, attr) != value
+            }
+            if self._optimistic:
+                state = replace(state, **self._optimistic)
+            else:
+                self._async_cancel_optimistic_timeout()
+        self._state = state
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_apply_optimistic(self, **changes):
+        """Show a commanded change before a poll confirms it."""
+        self._optimistic.update(changes)
+        self._state = replace(self._state, **changes)
+        self._async_cancel_optimistic_timeout()
+        self._unsub_optimistic = async_call_later(
+            self.hass, OPTIMISTIC_TIMEOUT, self._async_optimistic_timeout
+        )
+        self.coordinator.async_reset_update_interval()
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_revert_optimistic(self, *attrs):
+        """Drop the given optimistic values and show polled ones instead."""
+        for attr in attrs:
+            self._optimistic.pop(attr, None)
+        self._async_read_coordinator_state()
+
+    @callback
+    def _async_cancel_optimistic_timeout(self):
+        """Cancel the timer that drops unconfirmed optimistic values."""
+        if self._unsub_optimistic is not None:
+            self._unsub_optimistic()
+            self._unsub_optimistic = None
+
+    @callback
+    def _async_optimistic_timeout(self, _now):
+        """Fall back to the last polled state for unconfirmed changes."""
+        self._unsub_optimistic = None
+        self._optimistic = {}
+        self._async_read_coordinator_state()
+
+    @callback
+    def _async_write_state_if_changed(self):
+        """Write state only when a visible attribute changed."""
+        state = (
+            self.available,
+            self.hvac_mode,
+            self.hvac_action,
+            self.fan_mode,
+            self.current_temperature,
+            self.target_temperature,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.async_write_ha_state()
 
-    @property
+    @cached_property
     def device_id(self):
         """Return the ID of the physical device this sensor is part of."""
-        return self._heater.device_id
-
-    @property
-    def device_info(self):
-        """Return the device_info of the device."""
-        device_info = {
-            "identifiers": {(DOMAIN, self.device_id)},
-            "name": self.name,
-            "manufacturer": MANUFACTURER,
-            "model": "generation 2",
-        }
-        return device_info
+        return self._state.device_id
@@ -1,12 +1,17 @@
 """Constants for the LVI heater component."""
+from datetime import timedelta
 
 ATTR_AWAY_TEMP = "away_temp"
 ATTR_COMFORT_TEMP = "comfort_temp"
 ATTR_ROOM_NAME = "room_name"
 ATTR_SLEEP_TEMP = "sleep_temp"
+DATA_CONNECTION = "connection"
+DATA_COORDINATOR = "coordinator"
 MANUFACTURER = "Lvi"
 MAX_TEMP = 30
+MAX_UPDATE_INTERVAL = timedelta(minutes=15)
 MIN_TEMP = 5
 DOMAIN = "lvi"
 SERVICE_SET_ROOM_TEMP = "set_room_temperature"
+UPDATE_INTERVAL = timedelta(seconds=60)
 PRESET_PROGRAM = 'Program'
\ No newline at end of file
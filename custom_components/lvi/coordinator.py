@@ -0,0 +1,122 @@
+"""Data update coordinator for the LVI heater component."""
+
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, MAX_UPDATE_INTERVAL, UPDATE_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polls kept at UPDATE_INTERVAL after a user action, so a command the
+# backend has not applied yet does not count as an idle poll.
+USER_ACTION_POLLS = 3
+
+
+def _as_int(value):
+    """Convert a raw heater value to int, treating missing or bad data as 0."""
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass(frozen=True)
+class LviHeaterState:
+    """Snapshot of a heater's state with normalized field types."""
+
+    __slots__ = (
+        "device_id",
+        "available",
+        "heating_up",
+        "power_status",
+        "fan_speed",
+        "gv_mode",
+        "current_temp",
+        "consigne_confort",
+        "consigne_eco",
+        "consigne_boost",
+        "consigne_manuel",
+        "consigne_hg",
+    )
+
+    device_id: str
+    available: bool
+    heating_up: bool
+    power_status: int
+    fan_speed: int
+    gv_mode: str
+    current_temp: float
+    consigne_confort: float
+    consigne_eco: float
+    consigne_boost: float
+    consigne_manuel: float
+    consigne_hg: float
+
+    @classmethod
+    def from_heater(cls, heater):
+        """Create a state snapshot from a lvi heater object."""
+        return cls(
+            device_id=heater.device_id,
+            available=bool(heater.available),
+            heating_up=bool(_as_int(heater.heating_up)),
+            power_status=_as_int(heater.power_status),
+            fan_speed=_as_int(heater.fan_speed),
+            gv_mode=str(heater.gv_mode),
+            current_temp=heater.current_temp,
+            consigne_confort=heater.consigne_confort,
+            consigne_eco=heater.consigne_eco,
+            consigne_boost=heater.consigne_boost,
+            consigne_manuel=heater.consigne_manuel,
+            consigne_hg=heater.consigne_hg,
+        )
+
+
+class LviDataUpdateCoordinator(DataUpdateCoordinator):
+    """Fetch all heaters of a LVI account in a single request.
+
+    The polling interval doubles after every poll that returns unchanged
+    data, up to MAX_UPDATE_INTERVAL, and drops back to UPDATE_INTERVAL as
+    soon as something changes or the user sends a command. After a command
+    it stays at UPDATE_INTERVAL for USER_ACTION_POLLS polls.
+    """
+
+    def __init__(self, hass, lvi_data_connection):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self._conn = lvi_data_connection
+        self._base_polls_left = 0
+
+    async def _async_update_data(self):
+        """Fetch the state of all heaters."""
+        await self._conn.find_all_heaters()
+        data = {
+            heater.device_id: LviHeaterState.from_heater(heater)
+            for heater in self._conn.heaters.values()
+        }
+        if data == self.data:
+            if self._base_polls_left:
+                self._base_polls_left -= 1
+            else:
+                self.update_interval = min(
+                    MAX_UPDATE_INTERVAL, self.update_interval * 2
+                )
+        else:
+            self.update_interval = UPDATE_INTERVAL
+        return data
+
+    @callback
+    def async_reset_update_interval(self):
+        """Go back to the base polling interval, e.g. after a user action."""
+        self._base_polls_left = USER_ACTION_POLLS
+        if self.update_interval == UPDATE_INTERVAL:
+            return
+        self.update_interval = UPDATE_INTERVAL
+        self._schedule_refresh()